@@ -1 +1 @@
-# Backend package for Seizure Detection System
+# Backend package for Seizure Detection System
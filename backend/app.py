@@ -1,269 +1,448 @@
-from flask import Flask, render_template, request, jsonify, send_from_directory
-from flask_socketio import SocketIO, emit
-from PIL import Image
-import io
-import base64
-import random
-import logging
-import cv2
-import numpy as np
-from datetime import datetime
-from video_processing import VideoProcessor
-from detection import SeizureDetector
-
-# Configure logging
-logging.basicConfig(level=logging.INFO)
-logger = logging.getLogger(__name__)
-
-# Initialize Flask app
-app = Flask(__name__, static_folder='../frontend', template_folder='../frontend')
-app.config['SECRET_KEY'] = 'seizure_detection_secret_key_2024'
-
-# Initialize SocketIO
-socketio = SocketIO(app, cors_allowed_origins="*", async_mode='eventlet')
-
-class SeizureDetectionBackend:
-    def __init__(self):
-        self.video_processor = None
-        self.seizure_detector = None
-        self.is_monitoring = False
-        self.alert_count = 0
-        
-    def initialize_components(self):
-        """Initialize video processing and detection components"""
-        try:
-            self.video_processor = VideoProcessor()
-            self.seizure_detector = SeizureDetector()
-            logger.info("Components initialized successfully")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to initialize components: {e}")
-            return False
-    
-    def process_image(self, image_data):
-        """Process image data for seizure detection"""
-        try:
-            # Decode base64 image data
-            if ',' in image_data:
-                header, encoded = image_data.split(",", 1)
-            else:
-                encoded = image_data
-            
-            img_bytes = base64.b64decode(encoded)
-            
-            # Convert PIL Image to OpenCV format
-            image = Image.open(io.BytesIO(img_bytes))
-            image_np = np.array(image)
-            
-            # Convert RGB to BGR for OpenCV
-            if len(image_np.shape) == 3:
-                frame = cv2.cvtColor(image_np, cv2.COLOR_RGB2BGR)
-            else:
-                frame = image_np
-            
-            # Extract keypoints using MediaPipe
-            keypoints_data = self.video_processor.extract_keypoints(frame)
-            
-            if keypoints_data is not None:
-                # Analyze keypoints for seizure detection
-                detection_result = self.seizure_detector.analyze_movement(keypoints_data)
-                
-                if detection_result['alert']:
-                    self._handle_alert(detection_result)
-                
-                return detection_result
-            else:
-                # Fallback to random detection if no keypoints found
-                seizure_detected = random.choice([True, False, False, False])
-                return {
-                    'alert': seizure_detected,
-                    'type': 'fallback_detection',
-                    'confidence': 0.5 if seizure_detected else 0.0,
-                    'description': 'Seizure detected' if seizure_detected else 'No seizure detected'
-                }
-            
-        except Exception as e:
-            logger.error(f"Error processing image: {e}")
-            # Fallback to random detection
-            seizure_detected = random.choice([True, False, False, False])
-            return {
-                'alert': seizure_detected,
-                'type': 'error_fallback',
-                'confidence': 0.3 if seizure_detected else 0.0,
-                'description': 'Seizure detected' if seizure_detected else 'No seizure detected'
-            }
-    
-    def _handle_alert(self, detection_result):
-        """Handle detected seizure alert"""
-        self.alert_count += 1
-        alert_data = {
-            'timestamp': datetime.now().isoformat(),
-            'alert_type': detection_result['type'],
-            'confidence': detection_result['confidence'],
-            'description': detection_result['description']
-        }
-        
-        # Log the alert
-        self._log_alert(alert_data)
-        
-        # Send alert to all connected clients
-        socketio.emit('alert', alert_data, broadcast=True)
-        
-        logger.info(f"Alert triggered: {detection_result['type']}")
-    
-    def _log_alert(self, alert_data):
-        """Log alert to file"""
-        try:
-            log_entry = f"{alert_data['timestamp']} - {alert_data['alert_type']} - {alert_data['description']}\n"
-            with open('event_log.txt', 'a', encoding='utf-8') as f:
-                f.write(log_entry)
-        except Exception as e:
-            logger.error(f"Failed to log alert: {e}")
-
-    def start_monitoring(self):
-        """Start monitoring"""
-        if not self.is_monitoring:
-            self.is_monitoring = True
-            logger.info("Monitoring started")
-            return True
-        return False
-
-    def stop_monitoring(self):
-        """Stop monitoring"""
-        if self.is_monitoring:
-            self.is_monitoring = False
-            logger.info("Monitoring stopped")
-            return True
-        return False
-
-# Initialize backend
-backend = SeizureDetectionBackend()
-
-# Routes
-@app.route('/')
-def home():
-    """Serve the main application page"""
-    return send_from_directory('../frontend', 'index.html')
-
-@app.route('/<path:filename>')
-def serve_static(filename):
-    """Serve static files (CSS, JS)"""
-    return send_from_directory('../frontend', filename)
-
-@app.route('/detect', methods=['POST'])
-def detect():
-    """Handle image detection requests"""
-    try:
-        data = request.get_json()
-        if 'image' not in data:
-            return jsonify({'error': 'No image data'}), 400
-
-        image_data = data['image']
-        
-        # Process the image for seizure detection
-        result = backend.process_image(image_data)
-        
-        return jsonify({
-            'seizure_detected': result['alert'],
-            'detection_result': result
-        })
-    
-    except Exception as e:
-        logger.error(f"Error in detect endpoint: {e}")
-        return jsonify({'error': str(e)}), 500
-
-@app.route('/api/status')
-def get_status():
-    """Get current system status"""
-    return jsonify({
-        'is_monitoring': backend.is_monitoring,
-        'alert_count': backend.alert_count,
-        'components_ready': backend.video_processor is not None and backend.seizure_detector is not None
-    })
-
-@app.route('/api/start')
-def start_monitoring():
-    """Start monitoring via HTTP API"""
-    if backend.start_monitoring():
-        socketio.emit('status', {'message': 'Monitoring started', 'status': 'monitoring'}, broadcast=True)
-        return jsonify({'success': True, 'message': 'Monitoring started'})
-    return jsonify({'success': False, 'message': 'Monitoring already active'})
-
-@app.route('/api/stop')
-def stop_monitoring():
-    """Stop monitoring via HTTP API"""
-    if backend.stop_monitoring():
-        socketio.emit('status', {'message': 'Monitoring stopped', 'status': 'stopped'}, broadcast=True)
-        return jsonify({'success': True, 'message': 'Monitoring stopped'})
-    return jsonify({'success': False, 'message': 'Monitoring not active'})
-
-# WebSocket event handlers
-@socketio.on('connect')
-def handle_connect():
-    """Handle client connection"""
-    logger.info(f"Client connected: {request.sid}")
-    
-    # Send current status
-    emit('status', {
-        'message': 'Connected to server',
-        'status': 'connected'
-    })
-    
-    # Initialize components if not already done
-    if backend.video_processor is None:
-        if backend.initialize_components():
-            emit('status', {
-                'message': 'Components initialized successfully',
-                'status': 'ready'
-            })
-        else:
-            emit('status', {
-                'message': 'Failed to initialize components',
-                'status': 'error'
-            })
-
-@socketio.on('disconnect')
-def handle_disconnect():
-    """Handle client disconnection"""
-    logger.info(f"Client disconnected: {request.sid}")
-
-@socketio.on('start_monitoring')
-def handle_start_monitoring():
-    """Handle start monitoring request"""
-    if backend.start_monitoring():
-        emit('status', {'message': 'Monitoring started', 'status': 'monitoring'})
-        socketio.emit('status', {'message': 'Monitoring started', 'status': 'monitoring'}, broadcast=True)
-    else:
-        emit('status', {'message': 'Monitoring already active', 'status': 'monitoring'})
-
-@socketio.on('stop_monitoring')
-def handle_stop_monitoring():
-    """Handle stop monitoring request"""
-    if backend.stop_monitoring():
-        emit('status', {'message': 'Monitoring stopped', 'status': 'stopped'})
-        socketio.emit('status', {'message': 'Monitoring stopped', 'status': 'stopped'}, broadcast=True)
-    else:
-        emit('status', {'message': 'Monitoring not active', 'status': 'stopped'})
-
-@socketio.on('frame_data')
-def handle_frame_data(data):
-    """Handle frame data from frontend"""
-    try:
-        if 'frame' in data:
-            result = backend.process_image(data['frame'])
-            emit('processing_result', {
-                'detection_result': result,
-                'timestamp': datetime.now().isoformat()
-            })
-    except Exception as e:
-        logger.error(f"Error handling frame data: {e}")
-
-if __name__ == '__main__':
-    # Initialize components
-    if backend.initialize_components():
-        logger.info("Backend initialized successfully")
-        
-        # Run the application
-        socketio.run(app, host='0.0.0.0', port=5001, debug=True)
-    else:
-        logger.error("Failed to initialize backend components")
+from flask import Flask, render_template, request, send_from_directory
+import asyncio
+import socketio
+import uvicorn
+from asgiref.wsgi import WsgiToAsgi
+import orjson
+import pybase64
+import queue
+import xxhash
+import random
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import cv2
+import numpy as np
+from datetime import datetime
+from video_processing import VideoProcessor
+from detection import SeizureDetector
+
+# Configure logging
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+# Initialize Flask app
+app = Flask(__name__, static_folder='../frontend', template_folder='../frontend')
+app.config['SECRET_KEY'] = 'seizure_detection_secret_key_2024'
+
+class _OrjsonPackager:
+    """json-module shim so python-socketio serializes packets with orjson"""
+
+    @staticmethod
+    def dumps(obj, *args, **kwargs):
+        return orjson.dumps(obj).decode()
+
+    @staticmethod
+    def loads(data, *args, **kwargs):
+        return orjson.loads(data)
+
+def json_response(obj, status=200):
+    """Build an HTTP JSON response serialized with orjson"""
+    return app.response_class(orjson.dumps(obj), status=status, mimetype='application/json')
+
+# Async SocketIO server on uvloop/asyncio: uvicorn drives the event loop
+# and the Flask HTTP routes are served through the same ASGI app
+sio = socketio.AsyncServer(async_mode='asgi', cors_allowed_origins='*', json=_OrjsonPackager)
+asgi_app = socketio.ASGIApp(sio, WsgiToAsgi(app))
+
+# Event loop captured at connection time so worker threads can schedule
+# emits onto it
+_loop = None
+
+def emit_from_thread(event, data, room=None):
+    """Schedule a SocketIO emit onto the event loop from a worker thread"""
+    if _loop is not None:
+        asyncio.run_coroutine_threadsafe(sio.emit(event, data, room=room), _loop)
+
+class SeizureDetectionBackend:
+    def __init__(self):
+        self.video_processor = None
+        self.seizure_detector = None
+        self.is_monitoring = False
+        self.alert_count = 0
+        # Single worker thread for decode + pose inference: keeps the
+        # asyncio event loop free to service other clients while the GIL
+        # is released inside cv2/MediaPipe. One worker because the
+        # MediaPipe Pose instance is not thread-safe.
+        self.inference_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='inference')
+        # Pool of warm uint8 scratch frames: recycling the same buffers
+        # avoids a fresh multi-MB allocation (and the page faults that
+        # come with it) on every frame
+        self._frame_pool = queue.LifoQueue(maxsize=4)
+        # Fixed input size for pose inference: keeps per-frame MediaPipe
+        # cost (and worst-case latency) independent of source resolution
+        self.inference_size = (256, 256)
+        # Hash of the last encoded frame: bit-identical frames (idle feed)
+        # skip decode + pose inference and reuse the cached keypoints
+        self._last_frame_hash = None
+        self._last_keypoints = None
+        # Alert log entries are queued and flushed by a background writer
+        # so disk I/O never blocks the inference or event-loop threads
+        self._log_q = queue.Queue()
+        threading.Thread(target=self._log_writer, daemon=True).start()
+
+    def initialize_components(self):
+        """Initialize video processing and detection components"""
+        try:
+            self.video_processor = VideoProcessor()
+            self.seizure_detector = SeizureDetector()
+            logger.info("Components initialized successfully")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to initialize components: {e}")
+            return False
+    
+    def process_image(self, image_data):
+        """Process image data for seizure detection"""
+        # Short-circuit: no decode or inference while monitoring is off
+        if not self.is_monitoring:
+            return {
+                'alert': False,
+                'type': 'none',
+                'confidence': 0.0,
+                'description': 'Monitoring is not active'
+            }
+
+        try:
+            # Decode base64 image data (strip the data URL header without
+            # allocating a split list)
+            comma = image_data.find(',')
+            encoded = image_data[comma + 1:] if comma != -1 else image_data
+
+            img_bytes = pybase64.b64decode(encoded, validate=False)
+
+            # Duplicate frame: skip decode and MediaPipe entirely, but still
+            # run the (cheap) movement analysis on the cached keypoints so
+            # time-based detections like freezing episodes keep advancing
+            frame_hash = xxhash.xxh3_64_intdigest(img_bytes)
+            if frame_hash == self._last_frame_hash and self._last_keypoints is not None:
+                detection_result = self.seizure_detector.analyze_movement(self._last_keypoints)
+                if detection_result['alert']:
+                    self._handle_alert(detection_result)
+                return detection_result
+
+            # Decode directly to BGR with OpenCV (no intermediate PIL
+            # image) at half resolution: libjpeg-turbo's reduced-scale
+            # IDCT emits the downsampled image directly, so decode moves
+            # ~4x fewer bytes and pose inference sees a smaller input
+            buf = np.frombuffer(img_bytes, dtype=np.uint8)
+            frame = cv2.imdecode(buf, cv2.IMREAD_REDUCED_COLOR_2)
+            is_rgb = False
+
+            if frame is None:
+                # Fallback decoder: Pillow (or the Pillow-SIMD drop-in)
+                # handles payloads imdecode rejects and emits RGB, which
+                # MediaPipe consumes directly with no BGR round trip
+                frame = self._decode_with_pillow(img_bytes)
+                is_rgb = frame is not None
+
+            if frame is None:
+                logger.warning("Failed to decode image data")
+                seizure_detected = random.choice([True, False, False, False])
+                return {
+                    'alert': seizure_detected,
+                    'type': 'fallback_detection',
+                    'confidence': 0.5 if seizure_detected else 0.0,
+                    'description': 'Seizure detected' if seizure_detected else 'No seizure detected'
+                }
+
+            # Clamp to the fixed inference size, writing straight into a
+            # pooled scratch buffer (warm pages, no fresh allocation)
+            frame = self._resize_to_pooled(frame)
+
+            # Extract keypoints using MediaPipe
+            keypoints_data = self.video_processor.extract_keypoints(frame, rgb=is_rgb)
+
+            # MediaPipe copies its input internally, so the buffer can be
+            # recycled as soon as extract_keypoints returns
+            self._release_frame(frame)
+
+            self._last_frame_hash = frame_hash
+            self._last_keypoints = keypoints_data
+
+            if keypoints_data is not None:
+                # Analyze keypoints for seizure detection
+                detection_result = self.seizure_detector.analyze_movement(keypoints_data)
+                
+                if detection_result['alert']:
+                    self._handle_alert(detection_result)
+                
+                return detection_result
+            else:
+                # Fallback to random detection if no keypoints found
+                seizure_detected = random.choice([True, False, False, False])
+                return {
+                    'alert': seizure_detected,
+                    'type': 'fallback_detection',
+                    'confidence': 0.5 if seizure_detected else 0.0,
+                    'description': 'Seizure detected' if seizure_detected else 'No seizure detected'
+                }
+            
+        except Exception as e:
+            logger.error(f"Error processing image: {e}")
+            # Fallback to random detection
+            seizure_detected = random.choice([True, False, False, False])
+            return {
+                'alert': seizure_detected,
+                'type': 'error_fallback',
+                'confidence': 0.3 if seizure_detected else 0.0,
+                'description': 'Seizure detected' if seizure_detected else 'No seizure detected'
+            }
+    
+    def _decode_with_pillow(self, img_bytes):
+        """Decode with Pillow (Pillow-SIMD drop-in) when imdecode fails"""
+        try:
+            import io
+            from PIL import Image
+            with Image.open(io.BytesIO(img_bytes)) as image:
+                return np.asarray(image.convert('RGB'))
+        except Exception:
+            return None
+
+    def _resize_to_pooled(self, frame):
+        """Resize a decoded frame into a recycled fixed-size scratch buffer"""
+        width, height = self.inference_size
+        try:
+            buf = self._frame_pool.get_nowait()
+        except queue.Empty:
+            buf = np.empty((height, width, 3), dtype=np.uint8)
+        cv2.resize(frame, self.inference_size, dst=buf, interpolation=cv2.INTER_AREA)
+        return buf
+
+    def _release_frame(self, buf):
+        """Return a scratch buffer to the pool for reuse"""
+        try:
+            self._frame_pool.put_nowait(buf)
+        except queue.Full:
+            pass
+
+    def _handle_alert(self, detection_result):
+        """Handle detected seizure alert"""
+        self.alert_count += 1
+        alert_data = {
+            'timestamp': datetime.now().isoformat(),
+            'alert_type': detection_result['type'],
+            'confidence': detection_result['confidence'],
+            'description': detection_result['description']
+        }
+        
+        # Log the alert
+        self._log_alert(alert_data)
+        
+        # Fan out to the monitors room: the payload is serialized once
+        # and written to every subscribed client. _handle_alert runs on
+        # the inference thread, so the emit is scheduled onto the loop.
+        emit_from_thread('alert', alert_data, room='monitors')
+        
+        logger.info(f"Alert triggered: {detection_result['type']}")
+    
+    def _log_alert(self, alert_data):
+        """Queue an alert for the background log writer"""
+        log_entry = f"{alert_data['timestamp']} - {alert_data['alert_type']} - {alert_data['description']}\n"
+        self._log_q.put(log_entry)
+
+    def _log_writer(self):
+        """Drain queued entries, batching writes to the event log"""
+        try:
+            with open('event_log.txt', 'a', encoding='utf-8') as f:
+                while True:
+                    # Block for the first entry, then batch whatever else
+                    # is already queued into a single write
+                    entries = [self._log_q.get()]
+                    try:
+                        while len(entries) < 64:
+                            entries.append(self._log_q.get_nowait())
+                    except queue.Empty:
+                        pass
+                    f.write(''.join(entries))
+                    f.flush()
+        except Exception as e:
+            logger.error(f"Failed to log alert: {e}")
+
+    def start_monitoring(self):
+        """Start monitoring"""
+        if not self.is_monitoring:
+            self.is_monitoring = True
+            logger.info("Monitoring started")
+            return True
+        return False
+
+    def stop_monitoring(self):
+        """Stop monitoring"""
+        if self.is_monitoring:
+            self.is_monitoring = False
+            logger.info("Monitoring stopped")
+            return True
+        return False
+
+# Initialize backend and warm-load MediaPipe at import time so each
+# worker process pays the model-load cost once, before the first client
+# connects. Under gunicorn, run with --preload so the loaded graph is
+# shared copy-on-write across forked workers.
+backend = SeizureDetectionBackend()
+if backend.video_processor is None:
+    backend.initialize_components()
+
+# Routes
+@app.route('/')
+def home():
+    """Serve the main application page"""
+    return send_from_directory('../frontend', 'index.html')
+
+@app.route('/<path:filename>')
+def serve_static(filename):
+    """Serve static files (CSS, JS)"""
+    return send_from_directory('../frontend', filename)
+
+@app.route('/detect', methods=['POST'])
+def detect():
+    """Handle image detection requests"""
+    try:
+        data = orjson.loads(request.get_data())
+        if 'image' not in data:
+            return json_response({'error': 'No image data'}, status=400)
+
+        image_data = data['image']
+
+        # Run through the inference worker so the pose pipeline stays
+        # single-threaded alongside the SocketIO frame path
+        result = backend.inference_pool.submit(backend.process_image, image_data).result()
+
+        return json_response({
+            'seizure_detected': result['alert'],
+            'detection_result': result
+        })
+
+    except Exception as e:
+        logger.error(f"Error in detect endpoint: {e}")
+        return json_response({'error': str(e)}, status=500)
+
+@app.route('/api/status')
+def get_status():
+    """Get current system status"""
+    return json_response({
+        'is_monitoring': backend.is_monitoring,
+        'alert_count': backend.alert_count,
+        'components_ready': backend.video_processor is not None and backend.seizure_detector is not None
+    })
+
+@app.route('/api/start')
+def start_monitoring():
+    """Start monitoring via HTTP API"""
+    if backend.start_monitoring():
+        emit_from_thread('status', {'message': 'Monitoring started', 'status': 'monitoring'}, room='monitors')
+        return json_response({'success': True, 'message': 'Monitoring started'})
+    return json_response({'success': False, 'message': 'Monitoring already active'})
+
+@app.route('/api/stop')
+def stop_monitoring():
+    """Stop monitoring via HTTP API"""
+    if backend.stop_monitoring():
+        emit_from_thread('status', {'message': 'Monitoring stopped', 'status': 'stopped'}, room='monitors')
+        return json_response({'success': True, 'message': 'Monitoring stopped'})
+    return json_response({'success': False, 'message': 'Monitoring not active'})
+
+# WebSocket event handlers
+@sio.event
+async def connect(sid, environ):
+    """Handle client connection"""
+    global _loop
+    _loop = asyncio.get_running_loop()
+
+    logger.info(f"Client connected: {sid}")
+
+    # Every client receives alerts and status fanout through this room.
+    # enter_room is synchronous in python-socketio 5.8 (it only mutates
+    # the local room registry), so it must not be awaited.
+    sio.enter_room(sid, 'monitors')
+
+    # Send current status
+    await sio.emit('status', {
+        'message': 'Connected to server',
+        'status': 'connected'
+    }, to=sid)
+
+    # Components are loaded eagerly at import; just report readiness
+    if backend.video_processor is not None:
+        await sio.emit('status', {
+            'message': 'Components initialized successfully',
+            'status': 'ready'
+        }, to=sid)
+    else:
+        await sio.emit('status', {
+            'message': 'Failed to initialize components',
+            'status': 'error'
+        }, to=sid)
+
+# Frame coalescing: only the most recent frame per client is kept; when
+# the inference worker can't keep up, stale frames are dropped instead of
+# queueing behind it (they carry no value for real-time alerting)
+_pending_frames = {}
+_draining_sids = set()
+
+@sio.event
+async def disconnect(sid):
+    """Handle client disconnection"""
+    _pending_frames.pop(sid, None)
+    logger.info(f"Client disconnected: {sid}")
+
+@sio.on('start_monitoring')
+async def handle_start_monitoring(sid):
+    """Handle start monitoring request"""
+    if backend.start_monitoring():
+        await sio.emit('status', {'message': 'Monitoring started', 'status': 'monitoring'}, room='monitors')
+    else:
+        await sio.emit('status', {'message': 'Monitoring already active', 'status': 'monitoring'}, to=sid)
+
+@sio.on('stop_monitoring')
+async def handle_stop_monitoring(sid):
+    """Handle stop monitoring request"""
+    if backend.stop_monitoring():
+        await sio.emit('status', {'message': 'Monitoring stopped', 'status': 'stopped'}, room='monitors')
+    else:
+        await sio.emit('status', {'message': 'Monitoring not active', 'status': 'stopped'}, to=sid)
+
+async def _drain_frames(sid):
+    """Process the newest pending frame for a client until none remain"""
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            frame = _pending_frames.pop(sid, None)
+            if frame is None:
+                break
+            try:
+                # Decode + inference run on the dedicated worker thread;
+                # the event loop stays free to service other clients
+                result = await loop.run_in_executor(
+                    backend.inference_pool, backend.process_image, frame)
+                await sio.emit('processing_result', {
+                    'detection_result': result,
+                    'timestamp': datetime.now().isoformat()
+                }, to=sid)
+            except Exception as e:
+                logger.error(f"Error handling frame data: {e}")
+    finally:
+        _draining_sids.discard(sid)
+
+@sio.on('frame_data')
+async def handle_frame_data(sid, data):
+    """Handle frame data from frontend"""
+    if 'frame' not in data:
+        return
+
+    # Overwrite any frame still pending for this client, then make sure
+    # a drain task is running for it
+    _pending_frames[sid] = data['frame']
+    if sid not in _draining_sids:
+        _draining_sids.add(sid)
+        sio.start_background_task(_drain_frames, sid)
+
+if __name__ == '__main__':
+    # Components were initialized at import time
+    if backend.video_processor is not None:
+        logger.info("Backend initialized successfully")
+
+        # Run the application on uvicorn with the uvloop event loop
+        uvicorn.run(asgi_app, host='0.0.0.0', port=5001, loop='uvloop', http='httptools')
+    else:
+        logger.error("Failed to initialize backend components")
@@ -1,346 +1,457 @@
-import numpy as np
-import logging
-from typing import Dict, List, Optional
-from collections import deque
-import time
-
-logger = logging.getLogger(__name__)
-
-class SeizureDetector:
-    def __init__(self):
-        """Initialize seizure detection system"""
-        # Detection thresholds
-        self.fall_threshold = 0.6
-        self.rapid_movement_threshold = 50.0
-        self.immobility_threshold = 5.0
-        self.immobility_duration_threshold = 10.0  # seconds
-        
-        # State tracking
-        self.prev_keypoints = None
-        self.immobility_start_time = None
-        self.immobility_detected = False
-        self.alert_cooldown = 5.0  # seconds between alerts
-        self.last_alert_time = 0
-        
-        # Movement history for pattern analysis
-        self.movement_history = deque(maxlen=30)  # Store last 30 frames
-        self.velocity_history = deque(maxlen=30)
-        
-        # Seizure pattern detection
-        self.seizure_patterns = {
-            'tonic_clonic': {
-                'description': 'Tonic-clonic seizure with rhythmic movements',
-                'velocity_threshold': 80.0,
-                'pattern_threshold': 0.7
-            },
-            'myoclonic': {
-                'description': 'Myoclonic seizure with sudden jerks',
-                'velocity_threshold': 100.0,
-                'pattern_threshold': 0.6
-            },
-            'atonic': {
-                'description': 'Atonic seizure with sudden loss of muscle tone',
-                'velocity_threshold': 20.0,
-                'pattern_threshold': 0.8
-            }
-        }
-        
-        logger.info("SeizureDetector initialized successfully")
-    
-    def analyze_movement(self, keypoints_data: Dict) -> Dict:
-        """
-        Analyze movement patterns for seizure detection
-        
-        Args:
-            keypoints_data: Keypoints data from video processing
-            
-        Returns:
-            Dictionary with detection results
-        """
-        if keypoints_data is None or 'keypoints' not in keypoints_data:
-            return self._create_no_alert_result()
-        
-        keypoints = keypoints_data['keypoints']
-        current_time = time.time()
-        
-        # Check alert cooldown
-        if current_time - self.last_alert_time < self.alert_cooldown:
-            return self._create_no_alert_result()
-        
-        # Calculate velocities
-        velocities = self._calculate_velocities(keypoints)
-        
-        # Store in history
-        self.movement_history.append(keypoints)
-        self.velocity_history.append(velocities)
-        
-        # Perform detection analyses
-        detection_results = {
-            'fall': self._detect_fall(keypoints),
-            'rapid_movements': self._detect_rapid_movements(velocities),
-            'immobility': self._detect_immobility(keypoints),
-            'seizure_patterns': self._detect_seizure_patterns(velocities)
-        }
-        
-        # Determine overall alert
-        alert_result = self._determine_alert(detection_results)
-        
-        # Update state
-        self.prev_keypoints = keypoints
-        
-        if alert_result['alert']:
-            self.last_alert_time = current_time
-        
-        return alert_result
-    
-    def _calculate_velocities(self, keypoints: Dict) -> Dict:
-        """Calculate movement velocities for key body parts"""
-        if self.prev_keypoints is None:
-            return {}
-        
-        velocities = {}
-        important_parts = ['left_wrist', 'right_wrist', 'left_ankle', 'right_ankle', 'nose', 'left_shoulder', 'right_shoulder']
-        
-        for part in important_parts:
-            if part in keypoints and part in self.prev_keypoints:
-                curr_pos = (keypoints[part]['x'], keypoints[part]['y'])
-                prev_pos = (self.prev_keypoints[part]['x'], self.prev_keypoints[part]['y'])
-                
-                velocity = np.sqrt((curr_pos[0] - prev_pos[0])**2 + (curr_pos[1] - prev_pos[1])**2)
-                velocities[part] = velocity
-        
-        return velocities
-    
-    def _detect_fall(self, keypoints: Dict) -> Dict:
-        """Detect potential fall based on body position"""
-        try:
-            required_parts = ['nose', 'left_hip', 'right_hip', 'left_ankle', 'right_ankle']
-            if not all(part in keypoints for part in required_parts):
-                return {'detected': False, 'confidence': 0.0, 'reason': 'Missing keypoints'}
-            
-            # Calculate body position indicators
-            nose_y = keypoints['nose']['y']
-            hip_y = (keypoints['left_hip']['y'] + keypoints['right_hip']['y']) / 2
-            ankle_y = (keypoints['left_ankle']['y'] + keypoints['right_ankle']['y']) / 2
-            
-            # Check if body is horizontal (potential fall)
-            body_height = abs(hip_y - nose_y)
-            body_width = abs(ankle_y - hip_y)
-            
-            # Fall detection logic
-            is_horizontal = body_width > body_height * 1.5
-            is_low_position = nose_y > hip_y
-            
-            fall_confidence = 0.0
-            reason = ""
-            
-            if is_horizontal and is_low_position:
-                fall_confidence = 0.8
-                reason = "Body in horizontal position with head below hips"
-            elif is_horizontal:
-                fall_confidence = 0.6
-                reason = "Body in horizontal position"
-            elif is_low_position:
-                fall_confidence = 0.4
-                reason = "Head position below hips"
-            
-            return {
-                'detected': fall_confidence > self.fall_threshold,
-                'confidence': fall_confidence,
-                'reason': reason,
-                'body_height': body_height,
-                'body_width': body_width
-            }
-            
-        except Exception as e:
-            logger.error(f"Error in fall detection: {e}")
-            return {'detected': False, 'confidence': 0.0, 'reason': f'Error: {str(e)}'}
-    
-    def _detect_rapid_movements(self, velocities: Dict) -> Dict:
-        """Detect rapid repetitive movements"""
-        rapid_movements = []
-        
-        for part, velocity in velocities.items():
-            if velocity > self.rapid_movement_threshold:
-                rapid_movements.append({
-                    'part': part,
-                    'velocity': velocity,
-                    'severity': 'high' if velocity > self.rapid_movement_threshold * 2 else 'medium'
-                })
-        
-        if rapid_movements:
-            return {
-                'detected': True,
-                'confidence': min(0.9, len(rapid_movements) * 0.3),
-                'movements': rapid_movements,
-                'reason': f"Detected {len(rapid_movements)} rapid movements"
-            }
-        
-        return {
-            'detected': False,
-            'confidence': 0.0,
-            'movements': [],
-            'reason': "No rapid movements detected"
-        }
-    
-    def _detect_immobility(self, keypoints: Dict) -> Dict:
-        """Detect immobility (freezing episode)"""
-        if self.prev_keypoints is None:
-            return {'detected': False, 'confidence': 0.0, 'reason': 'No previous frame'}
-        
-        # Calculate total movement
-        total_movement = 0
-        movement_count = 0
-        
-        for part in keypoints:
-            if part in self.prev_keypoints:
-                curr_pos = (keypoints[part]['x'], keypoints[part]['y'])
-                prev_pos = (self.prev_keypoints[part]['x'], self.prev_keypoints[part]['y'])
-                
-                movement = np.sqrt((curr_pos[0] - prev_pos[0])**2 + (curr_pos[1] - prev_pos[1])**2)
-                total_movement += movement
-                movement_count += 1
-        
-        if movement_count > 0:
-            avg_movement = total_movement / movement_count
-            
-            if avg_movement < self.immobility_threshold:
-                if not self.immobility_detected:
-                    self.immobility_start_time = time.time()
-                    self.immobility_detected = True
-                
-                # Check if immobility has lasted long enough
-                if time.time() - self.immobility_start_time > self.immobility_duration_threshold:
-                    return {
-                        'detected': True,
-                        'confidence': 0.8,
-                        'reason': f"Freezing episode detected (duration: {time.time() - self.immobility_start_time:.1f}s)",
-                        'duration': time.time() - self.immobility_start_time
-                    }
-            else:
-                self.immobility_detected = False
-                self.immobility_start_time = None
-        
-        return {
-            'detected': False,
-            'confidence': 0.0,
-            'reason': "Normal movement detected"
-        }
-    
-    def _detect_seizure_patterns(self, velocities: Dict) -> Dict:
-        """Detect specific seizure patterns"""
-        detected_patterns = []
-        
-        for pattern_name, pattern_config in self.seizure_patterns.items():
-            pattern_result = self._analyze_seizure_pattern(velocities, pattern_config)
-            if pattern_result['detected']:
-                detected_patterns.append(pattern_result)
-        
-        if detected_patterns:
-            # Return the most confident pattern
-            best_pattern = max(detected_patterns, key=lambda x: x['confidence'])
-            return {
-                'detected': True,
-                'confidence': best_pattern['confidence'],
-                'pattern_type': best_pattern['pattern_type'],
-                'description': best_pattern['description'],
-                'reason': f"Detected {best_pattern['pattern_type']} seizure pattern"
-            }
-        
-        return {
-            'detected': False,
-            'confidence': 0.0,
-            'reason': "No seizure patterns detected"
-        }
-    
-    def _analyze_seizure_pattern(self, velocities: Dict, pattern_config: Dict) -> Dict:
-        """Analyze velocities for specific seizure patterns"""
-        high_velocity_count = 0
-        total_velocity = 0
-        
-        for part, velocity in velocities.items():
-            if velocity > pattern_config['velocity_threshold']:
-                high_velocity_count += 1
-            total_velocity += velocity
-        
-        if len(velocities) > 0:
-            avg_velocity = total_velocity / len(velocities)
-            pattern_consistency = self._calculate_pattern_consistency(velocities, pattern_config)
-            
-            if pattern_consistency > pattern_config['pattern_threshold']:
-                return {
-                    'detected': True,
-                    'confidence': pattern_consistency,
-                    'pattern_type': pattern_config['description'],
-                    'description': pattern_config['description'],
-                    'avg_velocity': avg_velocity
-                }
-        
-        return {
-            'detected': False,
-            'confidence': 0.0,
-            'pattern_type': pattern_config['description']
-        }
-    
-    def _calculate_pattern_consistency(self, velocities: Dict, pattern_config: Dict) -> float:
-        """Calculate consistency of movement pattern"""
-        if len(velocities) == 0:
-            return 0.0
-        
-        # Calculate how many movements exceed the threshold
-        high_velocity_ratio = sum(1 for v in velocities.values() if v > pattern_config['velocity_threshold']) / len(velocities)
-        
-        # Calculate average velocity relative to threshold
-        avg_velocity = sum(velocities.values()) / len(velocities)
-        velocity_ratio = avg_velocity / pattern_config['velocity_threshold']
-        
-        # Combine both factors
-        consistency = (high_velocity_ratio * 0.6) + (min(velocity_ratio, 1.0) * 0.4)
-        
-        return min(consistency, 1.0)
-    
-    def _determine_alert(self, detection_results: Dict) -> Dict:
-        """Determine if an alert should be triggered based on detection results"""
-        alerts = []
-        
-        # Check each detection type
-        for detection_type, result in detection_results.items():
-            if result['detected']:
-                alerts.append({
-                    'type': detection_type,
-                    'confidence': result['confidence'],
-                    'description': result.get('reason', ''),
-                    'details': result
-                })
-        
-        if alerts:
-            # Return the most confident alert
-            best_alert = max(alerts, key=lambda x: x['confidence'])
-            return {
-                'alert': True,
-                'type': best_alert['type'],
-                'confidence': best_alert['confidence'],
-                'description': best_alert['description'],
-                'details': best_alert['details']
-            }
-        
-        return self._create_no_alert_result()
-    
-    def _create_no_alert_result(self) -> Dict:
-        """Create a result indicating no alert"""
-        return {
-            'alert': False,
-            'type': 'none',
-            'confidence': 0.0,
-            'description': 'No abnormal movements detected'
-        }
-    
-    def reset_state(self):
-        """Reset detector state"""
-        self.prev_keypoints = None
-        self.immobility_start_time = None
-        self.immobility_detected = False
-        self.last_alert_time = 0
-        self.movement_history.clear()
-        self.velocity_history.clear()
-        logger.info("SeizureDetector state reset")
+import numpy as np
+import logging
+from typing import Dict, List, Optional
+from numba import njit
+import time
+
+logger = logging.getLogger(__name__)
+
+@njit(cache=True, fastmath=True)
+def _pattern_consistencies(velocities_sq, thresholds):
+    """Compute the pattern-consistency score for every seizure pattern
+    threshold in one native-code pass over the squared-velocity array"""
+    out = np.empty(thresholds.shape[0], dtype=np.float32)
+    # True mean velocity: one vectorized sqrt over the handful of parts
+    # (RMS would overweight outliers and inflate the consistency score)
+    avg = np.sqrt(velocities_sq).mean()
+    for k in range(thresholds.shape[0]):
+        thr = thresholds[k]
+        high_ratio = (velocities_sq > thr * thr).sum() / velocities_sq.size
+        out[k] = min(high_ratio * 0.6 + min(avg / thr, 1.0) * 0.4, 1.0)
+    return out
+
+# Keypoint order used for the structure-of-arrays layout (matches the
+# names emitted by VideoProcessor.extract_keypoints)
+PART_NAMES = (
+    'nose', 'left_shoulder', 'right_shoulder', 'left_wrist', 'right_wrist',
+    'left_hip', 'right_hip', 'left_ankle', 'right_ankle'
+)
+
+# Row constants into the (N, 2) keypoint array
+NOSE, L_SHOULDER, R_SHOULDER, L_WRIST, R_WRIST, L_HIP, R_HIP, L_ANKLE, R_ANKLE = range(len(PART_NAMES))
+
+# Preallocated no-detection results for the fast paths. Nothing is
+# detected on the vast majority of frames, so returning these shared
+# dicts avoids a fresh allocation per detector per frame. Treat them as
+# immutable: callers only ever read them.
+_NO_FALL = {'detected': False, 'confidence': 0.0, 'reason': ''}
+_NO_RAPID = {'detected': False, 'confidence': 0.0, 'movements': [],
+             'reason': 'No rapid movements detected'}
+_NO_PREV_FRAME = {'detected': False, 'confidence': 0.0, 'reason': 'No previous frame'}
+_NO_IMMOBILITY = {'detected': False, 'confidence': 0.0, 'reason': 'Normal movement detected'}
+_NO_PATTERN = {'detected': False, 'confidence': 0.0, 'reason': 'No seizure patterns detected'}
+
+class SeizureDetector:
+    def __init__(self):
+        """Initialize seizure detection system"""
+        # Detection thresholds
+        self.fall_threshold = 0.6
+        self.rapid_movement_threshold = 50.0
+        self.immobility_threshold = 5.0
+        self.immobility_duration_threshold = 10.0  # seconds
+
+        # Structure-of-arrays keypoint layout: one (N, 2) float32 array per
+        # frame instead of a dict-of-dicts, so velocity/immobility math is
+        # a single vectorized pass
+        self._part_index = {name: i for i, name in enumerate(PART_NAMES)}
+        important_parts = ['left_wrist', 'right_wrist', 'left_ankle', 'right_ankle', 'nose', 'left_shoulder', 'right_shoulder']
+        self._important_parts = important_parts
+        self._important_rows = np.array([self._part_index[p] for p in important_parts], dtype=np.int64)
+
+        # State tracking
+        self.prev_keypoints = None
+        self._prev_xy = None
+        self.immobility_start_time = None
+        self.immobility_detected = False
+        self.alert_cooldown = 5.0  # seconds between alerts
+        self.last_alert_time = 0
+
+        # Frames the video layer held (skipped inference) since the last
+        # real detection; velocities on the next real frame span this
+        # many frame intervals and are normalized accordingly
+        self._held_frames = 0
+        
+        # Movement history for pattern analysis: a preallocated ring
+        # buffer (contiguous, allocation-free O(1) writes) holding the
+        # last 30 frames of keypoints. Pixel coordinates are already
+        # rounded to integers upstream and fit int16, which halves the
+        # bytes every window scan has to move.
+        self.history_size = 30
+        self._kp_hist = np.zeros((self.history_size, len(PART_NAMES), 2), dtype=np.int16)
+        self._hist_head = 0
+        self._hist_count = 0
+        
+        # Seizure pattern detection
+        self.seizure_patterns = {
+            'tonic_clonic': {
+                'description': 'Tonic-clonic seizure with rhythmic movements',
+                'velocity_threshold': 80.0,
+                'pattern_threshold': 0.7
+            },
+            'myoclonic': {
+                'description': 'Myoclonic seizure with sudden jerks',
+                'velocity_threshold': 100.0,
+                'pattern_threshold': 0.6
+            },
+            'atonic': {
+                'description': 'Atonic seizure with sudden loss of muscle tone',
+                'velocity_threshold': 20.0,
+                'pattern_threshold': 0.8
+            }
+        }
+        
+        # Flat threshold array for the JIT-compiled consistency kernel
+        self._pattern_names = list(self.seizure_patterns)
+        self._pattern_thresholds = np.array(
+            [self.seizure_patterns[n]['velocity_threshold'] for n in self._pattern_names],
+            dtype=np.float32
+        )
+
+        # The pixel-space thresholds above are calibrated for a
+        # reference_height-tall capture, but frames reach the detector
+        # at the fixed inference size, so the working copies below are
+        # rescaled to the frame's actual coordinate space (the squared
+        # variant keeps the comparisons sqrt-free). The scale only
+        # changes when the frame shape does.
+        self.reference_height = 480.0
+        self._frame_height = None
+        self._rapid_threshold_px = self.rapid_movement_threshold
+        self._rapid_threshold_px_sq = self.rapid_movement_threshold ** 2
+        self._immobility_threshold_px = self.immobility_threshold
+        self._pattern_thresholds_px = self._pattern_thresholds
+
+        # Pay the kernel JIT-compile cost at startup, not on the first
+        # frame that reaches the pattern analysis
+        _pattern_consistencies(np.zeros(1, dtype=np.float32), self._pattern_thresholds)
+
+        logger.info("SeizureDetector initialized successfully")
+    
+    def analyze_movement(self, keypoints_data: Dict) -> Dict:
+        """
+        Analyze movement patterns for seizure detection
+        
+        Args:
+            keypoints_data: Keypoints data from video processing
+            
+        Returns:
+            Dictionary with detection results
+        """
+        if keypoints_data is None or 'keypoints' not in keypoints_data:
+            return self._create_no_alert_result()
+        
+        keypoints = keypoints_data['keypoints']
+        current_time = time.time()
+
+        # Check alert cooldown
+        if current_time - self.last_alert_time < self.alert_cooldown:
+            return self._create_no_alert_result()
+
+        # Convert to the (N, 2) SoA layout once per frame
+        curr_xy = self._to_xy_array(keypoints)
+        if curr_xy is None:
+            return self._create_no_alert_result()
+
+        # Keep the pixel thresholds in the frame's coordinate space
+        self._update_threshold_scale(keypoints_data.get('frame_shape'))
+
+        # Held frame: the video layer skipped inference and repeated the
+        # last real detection, so the position carries no new motion
+        # information. Run only the position-based fall check and leave
+        # the velocity anchor, history and immobility timer untouched.
+        if keypoints_data.get('interpolated'):
+            self._held_frames += 1
+            alert_result = self._determine_alert({
+                'fall': self._detect_fall(curr_xy),
+                'rapid_movements': _NO_RAPID,
+                'immobility': _NO_IMMOBILITY,
+                'seizure_patterns': _NO_PATTERN
+            })
+            alert_result['window'] = self.analyze_window()
+            if alert_result['alert']:
+                self.last_alert_time = current_time
+            return alert_result
+
+        # Calculate per-part squared movement in one vectorized pass
+        movements_sq = self._calculate_velocities(curr_xy)
+        velocities_sq = movements_sq[self._important_rows] if movements_sq.size else movements_sq
+
+        # Store in history (ring-buffer write, no allocation)
+        self._kp_hist[self._hist_head] = curr_xy
+        self._hist_head = (self._hist_head + 1) % self.history_size
+        self._hist_count = min(self._hist_count + 1, self.history_size)
+
+        # Perform all detection analyses in one fused pass over the arrays
+        detection_results = self._analyze_fused(curr_xy, movements_sq, velocities_sq)
+
+        # Determine overall alert, with windowed context so single-frame
+        # spikes can be judged against the recent history
+        alert_result = self._determine_alert(detection_results)
+        alert_result['window'] = self.analyze_window()
+
+        # Update state
+        self.prev_keypoints = keypoints
+        self._prev_xy = curr_xy
+        self._held_frames = 0
+
+        if alert_result['alert']:
+            self.last_alert_time = current_time
+
+        return alert_result
+
+    def _update_threshold_scale(self, frame_shape) -> None:
+        """Rescale the working pixel thresholds to the frame's height.
+
+        The configured thresholds assume a reference_height-tall frame;
+        the inference pipeline hands the detector coordinates in a much
+        smaller fixed space, which would otherwise make velocity
+        thresholds proportionally harder to trip.
+        """
+        height = float(frame_shape[0]) if frame_shape else self.reference_height
+        if height == self._frame_height:
+            return
+
+        self._frame_height = height
+        scale = height / self.reference_height
+        self._rapid_threshold_px = self.rapid_movement_threshold * scale
+        self._rapid_threshold_px_sq = self._rapid_threshold_px ** 2
+        self._immobility_threshold_px = self.immobility_threshold * scale
+        self._pattern_thresholds_px = (self._pattern_thresholds * scale).astype(np.float32)
+
+    def _to_xy_array(self, keypoints: np.ndarray) -> Optional[np.ndarray]:
+        """Pull the (N, 2) coordinate block from the (N, 4) keypoint array"""
+        if keypoints is None or len(keypoints) != len(PART_NAMES):
+            return None
+        return np.ascontiguousarray(keypoints[:, :2], dtype=np.float32)
+
+    def _calculate_velocities(self, curr_xy: np.ndarray) -> np.ndarray:
+        """Calculate per-part squared movement magnitudes in one
+        vectorized op; comparisons downstream stay in squared space"""
+        if self._prev_xy is None:
+            return np.empty(0, dtype=np.float32)
+
+        diff = curr_xy - self._prev_xy
+        movements_sq = np.einsum('ij,ij->i', diff, diff)
+
+        # The previous anchor is several frames old when inference was
+        # skipped in between; normalize to per-frame velocity (squared
+        # space, hence the squared gap)
+        gap = self._held_frames + 1
+        if gap > 1:
+            movements_sq /= gap * gap
+        return movements_sq
+    
+    def _analyze_fused(self, curr_xy: np.ndarray, movements_sq: np.ndarray,
+                       velocities_sq: np.ndarray) -> Dict:
+        """Run fall, rapid-movement, immobility and seizure-pattern
+        analysis from the per-frame arrays computed once above"""
+        return {
+            'fall': self._detect_fall(curr_xy),
+            'rapid_movements': self._detect_rapid_movements(velocities_sq),
+            'immobility': self._detect_immobility(movements_sq),
+            'seizure_patterns': self._detect_seizure_patterns(velocities_sq)
+        }
+
+    def _detect_fall(self, curr_xy: np.ndarray) -> Dict:
+        """Detect potential fall based on body position"""
+        try:
+            # Calculate body position indicators straight from array rows
+            nose_y = float(curr_xy[NOSE, 1])
+            hip_y = float(curr_xy[L_HIP, 1] + curr_xy[R_HIP, 1]) / 2
+            ankle_y = float(curr_xy[L_ANKLE, 1] + curr_xy[R_ANKLE, 1]) / 2
+
+            # Check if body is horizontal (potential fall)
+            body_height = abs(hip_y - nose_y)
+            body_width = abs(ankle_y - hip_y)
+            
+            # Fall detection logic
+            is_horizontal = body_width > body_height * 1.5
+            is_low_position = nose_y > hip_y
+            
+            fall_confidence = 0.0
+            reason = ""
+            
+            if is_horizontal and is_low_position:
+                fall_confidence = 0.8
+                reason = "Body in horizontal position with head below hips"
+            elif is_horizontal:
+                fall_confidence = 0.6
+                reason = "Body in horizontal position"
+            elif is_low_position:
+                fall_confidence = 0.4
+                reason = "Head position below hips"
+            else:
+                return _NO_FALL
+
+            return {
+                'detected': fall_confidence > self.fall_threshold,
+                'confidence': fall_confidence,
+                'reason': reason,
+                'body_height': body_height,
+                'body_width': body_width
+            }
+            
+        except Exception as e:
+            logger.error(f"Error in fall detection: {e}")
+            return {'detected': False, 'confidence': 0.0, 'reason': f'Error: {str(e)}'}
+    
+    def _detect_rapid_movements(self, velocities_sq: np.ndarray) -> Dict:
+        """Detect rapid repetitive movements"""
+        # One vectorized compare in squared space; everything below the
+        # hit check is skipped entirely on the common negative frame
+        mask = velocities_sq > self._rapid_threshold_px_sq
+        hit_count = int(np.count_nonzero(mask))
+
+        if hit_count:
+            idx = mask.nonzero()[0]
+            fired_sq = velocities_sq[idx]
+            fired_vel = np.sqrt(fired_sq)
+            severities = np.where(
+                fired_sq > (self._rapid_threshold_px * 2) ** 2, 'high', 'medium')
+            rapid_movements = [
+                {'part': self._important_parts[i], 'velocity': float(v), 'severity': str(s)}
+                for i, v, s in zip(idx, fired_vel, severities)
+            ]
+            return {
+                'detected': True,
+                'confidence': min(0.9, hit_count * 0.3),
+                'movements': rapid_movements,
+                'reason': f"Detected {hit_count} rapid movements"
+            }
+
+        return _NO_RAPID
+    
+    def _detect_immobility(self, movements_sq: np.ndarray) -> Dict:
+        """Detect immobility (freezing episode)"""
+        if movements_sq.size == 0:
+            return _NO_PREV_FRAME
+
+        # True mean movement across all keypoints: one vectorized sqrt
+        # (RMS overweights single-limb spikes and under-detects freezing)
+        avg_movement = float(np.sqrt(movements_sq).mean())
+
+        if avg_movement < self._immobility_threshold_px:
+            if not self.immobility_detected:
+                self.immobility_start_time = time.time()
+                self.immobility_detected = True
+
+            # Check if immobility has lasted long enough
+            if time.time() - self.immobility_start_time > self.immobility_duration_threshold:
+                return {
+                    'detected': True,
+                    'confidence': 0.8,
+                    'reason': f"Freezing episode detected (duration: {time.time() - self.immobility_start_time:.1f}s)",
+                    'duration': time.time() - self.immobility_start_time
+                }
+        else:
+            self.immobility_detected = False
+            self.immobility_start_time = None
+
+        return _NO_IMMOBILITY
+    
+    def _detect_seizure_patterns(self, velocities_sq: np.ndarray) -> Dict:
+        """Detect specific seizure patterns"""
+        if velocities_sq.size == 0:
+            return _NO_PATTERN
+
+        # One JIT-compiled pass computes the consistency for all patterns
+        consistencies = _pattern_consistencies(velocities_sq, self._pattern_thresholds_px)
+
+        best_name = None
+        best_confidence = 0.0
+        for k, pattern_name in enumerate(self._pattern_names):
+            pattern_config = self.seizure_patterns[pattern_name]
+            confidence = float(consistencies[k])
+            if confidence > pattern_config['pattern_threshold'] and confidence > best_confidence:
+                best_name = pattern_name
+                best_confidence = confidence
+
+        if best_name is not None:
+            description = self.seizure_patterns[best_name]['description']
+            return {
+                'detected': True,
+                'confidence': best_confidence,
+                'pattern_type': description,
+                'description': description,
+                'reason': f"Detected {description} seizure pattern"
+            }
+
+        return _NO_PATTERN
+
+    def analyze_window(self) -> Optional[Dict]:
+        """Compute movement statistics over the whole keypoint history
+        window in one vectorized pass
+
+        Per-frame detections see instantaneous spikes; the windowed
+        velocities here describe the last `history_size` frames, so
+        consumers can tell a sustained episode from a single-frame
+        glitch. Returns None until the ring holds at least two frames.
+        """
+        if self._hist_count < 2:
+            return None
+
+        # Chronological view of the ring: oldest frame first
+        start = (self._hist_head - self._hist_count) % self.history_size
+        order = (start + np.arange(self._hist_count)) % self.history_size
+        window = self._kp_hist[order]
+
+        # (frames-1, parts) per-part velocities across the window; the
+        # int16 loads upcast to float32 only once, in the diff
+        velocities = np.linalg.norm(np.diff(window, axis=0).astype(np.float32), axis=2)
+        frame_avg = velocities.mean(axis=1)
+
+        return {
+            'frames': self._hist_count,
+            'avg_velocity': float(frame_avg.mean()),
+            'peak_velocity': float(velocities.max()),
+            'immobile_fraction': float((frame_avg < self._immobility_threshold_px).mean()),
+            'rapid_fraction': float(np.any(velocities > self._rapid_threshold_px, axis=1).mean())
+        }
+
+    def _determine_alert(self, detection_results: Dict) -> Dict:
+        """Determine if an alert should be triggered based on detection results"""
+        alerts = []
+        
+        # Check each detection type
+        for detection_type, result in detection_results.items():
+            if result['detected']:
+                alerts.append({
+                    'type': detection_type,
+                    'confidence': result['confidence'],
+                    'description': result.get('reason', ''),
+                    'details': result
+                })
+        
+        if alerts:
+            # Return the most confident alert
+            best_alert = max(alerts, key=lambda x: x['confidence'])
+            return {
+                'alert': True,
+                'type': best_alert['type'],
+                'confidence': best_alert['confidence'],
+                'description': best_alert['description'],
+                'details': best_alert['details']
+            }
+        
+        return self._create_no_alert_result()
+    
+    def _create_no_alert_result(self) -> Dict:
+        """Create a result indicating no alert"""
+        return {
+            'alert': False,
+            'type': 'none',
+            'confidence': 0.0,
+            'description': 'No abnormal movements detected'
+        }
+    
+    def reset_state(self):
+        """Reset detector state"""
+        self.prev_keypoints = None
+        self._prev_xy = None
+        self._held_frames = 0
+        self.immobility_start_time = None
+        self.immobility_detected = False
+        self.last_alert_time = 0
+        self._kp_hist[:] = 0
+        self._hist_head = 0
+        self._hist_count = 0
+        logger.info("SeizureDetector state reset")
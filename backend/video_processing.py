@@ -1,323 +1,569 @@
-import cv2
-import mediapipe as mp
-import numpy as np
-import logging
-from typing import Optional, Dict, List, Tuple
-
-logger = logging.getLogger(__name__)
-
-class VideoProcessor:
-    def __init__(self):
-        """Initialize video processing with MediaPipe pose detection"""
-        try:
-            self.mp_pose = mp.solutions.pose
-            self.mp_drawing = mp.solutions.drawing_utils
-            self.mp_drawing_styles = mp.solutions.drawing_styles
-            
-            # Initialize MediaPipe Pose with robust settings
-            self.pose = self.mp_pose.Pose(
-                static_image_mode=False,
-                model_complexity=1,
-                smooth_landmarks=True,
-                enable_segmentation=False,
-                smooth_segmentation=True,
-                min_detection_confidence=0.5,
-                min_tracking_confidence=0.5
-            )
-            
-            # Keypoint mapping for easier access
-            self.keypoint_names = {
-                'nose': 0,
-                'left_eye': 2,
-                'right_eye': 5,
-                'left_ear': 7,
-                'right_ear': 8,
-                'left_shoulder': 11,
-                'right_shoulder': 12,
-                'left_elbow': 13,
-                'right_elbow': 14,
-                'left_wrist': 15,
-                'right_wrist': 16,
-                'left_hip': 23,
-                'right_hip': 24,
-                'left_knee': 25,
-                'right_knee': 26,
-                'left_ankle': 27,
-                'right_ankle': 28
-            }
-            
-            logger.info("VideoProcessor initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize VideoProcessor: {e}")
-            raise
-    
-    def extract_keypoints(self, frame: np.ndarray) -> Optional[Dict]:
-        """
-        Extract body keypoints from a video frame using MediaPipe
-        
-        Args:
-            frame: Input video frame (BGR format)
-            
-        Returns:
-            Dictionary containing keypoints data or None if no pose detected
-        """
-        try:
-            if frame is None:
-                logger.warning("Received None frame")
-                return None
-            
-            # Convert BGR to RGB
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Process the frame
-            results = self.pose.process(rgb_frame)
-            
-            if results.pose_landmarks is None:
-                return None
-            
-            # Extract keypoints
-            keypoints = self._extract_landmarks(results.pose_landmarks, frame.shape)
-            
-            return {
-                'keypoints': keypoints,
-                'landmarks': results.pose_landmarks,
-                'frame_shape': frame.shape
-            }
-            
-        except Exception as e:
-            logger.error(f"Error extracting keypoints: {e}")
-            return None
-    
-    def _extract_landmarks(self, landmarks, frame_shape: Tuple[int, int, int]) -> Dict:
-        """
-        Extract landmark coordinates and convert to pixel coordinates
-        
-        Args:
-            landmarks: MediaPipe pose landmarks
-            frame_shape: Shape of the input frame (height, width, channels)
-            
-        Returns:
-            Dictionary with keypoint coordinates
-        """
-        height, width = frame_shape[:2]
-        keypoints = {}
-        
-        for name, idx in self.keypoint_names.items():
-            landmark = landmarks.landmark[idx]
-            
-            # Convert normalized coordinates to pixel coordinates
-            x = int(landmark.x * width)
-            y = int(landmark.y * height)
-            z = landmark.z  # Keep normalized depth
-            
-            keypoints[name] = {
-                'x': x,
-                'y': y,
-                'z': z,
-                'visibility': landmark.visibility
-            }
-        
-        return keypoints
-    
-    def calculate_movement_velocity(self, keypoints: Dict, prev_keypoints: Optional[Dict]) -> Dict:
-        """
-        Calculate movement velocity for key body parts
-        
-        Args:
-            keypoints: Current frame keypoints
-            prev_keypoints: Previous frame keypoints
-            
-        Returns:
-            Dictionary with velocity data for different body parts
-        """
-        if prev_keypoints is None:
-            return {}
-        
-        velocities = {}
-        
-        # Calculate velocity for important body parts
-        important_parts = ['left_wrist', 'right_wrist', 'left_ankle', 'right_ankle', 'nose']
-        
-        for part in important_parts:
-            if part in keypoints and part in prev_keypoints:
-                curr_pos = (keypoints[part]['x'], keypoints[part]['y'])
-                prev_pos = (prev_keypoints[part]['x'], prev_keypoints[part]['y'])
-                
-                # Calculate Euclidean distance
-                velocity = np.sqrt((curr_pos[0] - prev_pos[0])**2 + (curr_pos[1] - prev_pos[1])**2)
-                velocities[part] = velocity
-        
-        return velocities
-    
-    def detect_fall(self, keypoints: Dict) -> Dict:
-        """
-        Detect potential fall based on body position
-        
-        Args:
-            keypoints: Current frame keypoints
-            
-        Returns:
-            Dictionary with fall detection results
-        """
-        try:
-            # Check if key body parts are detected
-            required_parts = ['nose', 'left_hip', 'right_hip', 'left_ankle', 'right_ankle']
-            if not all(part in keypoints for part in required_parts):
-                return {'detected': False, 'confidence': 0.0, 'reason': 'Missing keypoints'}
-            
-            # Calculate body position indicators
-            nose_y = keypoints['nose']['y']
-            hip_y = (keypoints['left_hip']['y'] + keypoints['right_hip']['y']) / 2
-            ankle_y = (keypoints['left_ankle']['y'] + keypoints['right_ankle']['y']) / 2
-            
-            # Check if body is horizontal (potential fall)
-            body_height = abs(hip_y - nose_y)
-            body_width = abs(ankle_y - hip_y)
-            
-            # Fall detection logic
-            is_horizontal = body_width > body_height * 1.5  # Body is more horizontal than vertical
-            is_low_position = nose_y > hip_y  # Head is below hips
-            
-            fall_confidence = 0.0
-            reason = ""
-            
-            if is_horizontal and is_low_position:
-                fall_confidence = 0.8
-                reason = "Body in horizontal position with head below hips"
-            elif is_horizontal:
-                fall_confidence = 0.6
-                reason = "Body in horizontal position"
-            elif is_low_position:
-                fall_confidence = 0.4
-                reason = "Head position below hips"
-            
-            return {
-                'detected': fall_confidence > 0.5,
-                'confidence': fall_confidence,
-                'reason': reason,
-                'body_height': body_height,
-                'body_width': body_width
-            }
-            
-        except Exception as e:
-            logger.error(f"Error in fall detection: {e}")
-            return {'detected': False, 'confidence': 0.0, 'reason': f'Error: {str(e)}'}
-    
-    def detect_rapid_movements(self, velocities: Dict, threshold: float = 50.0) -> Dict:
-        """
-        Detect rapid repetitive movements
-        
-        Args:
-            velocities: Movement velocities for body parts
-            threshold: Velocity threshold for rapid movement detection
-            
-        Returns:
-            Dictionary with rapid movement detection results
-        """
-        rapid_movements = []
-        
-        for part, velocity in velocities.items():
-            if velocity > threshold:
-                rapid_movements.append({
-                    'part': part,
-                    'velocity': velocity,
-                    'severity': 'high' if velocity > threshold * 2 else 'medium'
-                })
-        
-        if rapid_movements:
-            return {
-                'detected': True,
-                'confidence': min(0.9, len(rapid_movements) * 0.3),
-                'movements': rapid_movements,
-                'reason': f"Detected {len(rapid_movements)} rapid movements"
-            }
-        
-        return {
-            'detected': False,
-            'confidence': 0.0,
-            'movements': [],
-            'reason': "No rapid movements detected"
-        }
-    
-    def detect_immobility(self, keypoints: Dict, prev_keypoints: Optional[Dict], 
-                         immobility_threshold: float = 5.0) -> Dict:
-        """
-        Detect immobility (freezing episode)
-        
-        Args:
-            keypoints: Current frame keypoints
-            prev_keypoints: Previous frame keypoints
-            immobility_threshold: Threshold for considering movement as immobile
-            
-        Returns:
-            Dictionary with immobility detection results
-        """
-        if prev_keypoints is None:
-            return {'detected': False, 'confidence': 0.0, 'reason': 'No previous frame'}
-        
-        # Calculate total movement across all keypoints
-        total_movement = 0
-        movement_count = 0
-        
-        for part in keypoints:
-            if part in prev_keypoints:
-                curr_pos = (keypoints[part]['x'], keypoints[part]['y'])
-                prev_pos = (prev_keypoints[part]['x'], prev_keypoints[part]['y'])
-                
-                movement = np.sqrt((curr_pos[0] - prev_pos[0])**2 + (curr_pos[1] - prev_pos[1])**2)
-                total_movement += movement
-                movement_count += 1
-        
-        if movement_count > 0:
-            avg_movement = total_movement / movement_count
-            
-            if avg_movement < immobility_threshold:
-                return {
-                    'detected': True,
-                    'confidence': 0.7,
-                    'reason': f"Low movement detected (avg: {avg_movement:.2f})",
-                    'avg_movement': avg_movement
-                }
-        
-        return {
-            'detected': False,
-            'confidence': 0.0,
-            'reason': "Normal movement detected",
-            'avg_movement': avg_movement if movement_count > 0 else 0
-        }
-    
-    def draw_keypoints(self, frame: np.ndarray, keypoints_data: Dict) -> np.ndarray:
-        """
-        Draw keypoints on the frame for visualization
-        
-        Args:
-            frame: Input frame
-            keypoints_data: Keypoints data from extract_keypoints
-            
-        Returns:
-            Frame with keypoints drawn
-        """
-        if keypoints_data is None or 'landmarks' not in keypoints_data:
-            return frame
-        
-        # Create a copy of the frame
-        annotated_frame = frame.copy()
-        
-        # Draw the pose landmarks
-        self.mp_drawing.draw_landmarks(
-            annotated_frame,
-            keypoints_data['landmarks'],
-            self.mp_pose.POSE_CONNECTIONS,
-            landmark_drawing_spec=self.mp_drawing_styles.get_default_pose_landmarks_style()
-        )
-        
-        return annotated_frame
-    
-    def release(self):
-        """Release resources"""
-        try:
-            if hasattr(self, 'pose'):
-                self.pose.close()
-            logger.info("VideoProcessor resources released")
-        except Exception as e:
-            logger.error(f"Error releasing VideoProcessor resources: {e}")
+import cv2
+import mediapipe as mp
+import numpy as np
+import logging
+import queue
+import threading
+from numba import njit
+from typing import Callable, Optional, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Shared no-detection results for the fast paths; treated as immutable
+# by every caller, so one allocation covers the common per-frame case
+_NO_RAPID = {'detected': False, 'confidence': 0.0, 'movements': [],
+             'reason': 'No rapid movements detected'}
+_NO_PREV_FRAME = {'detected': False, 'confidence': 0.0, 'reason': 'No previous frame'}
+_NO_IMMOBILITY = {'detected': False, 'confidence': 0.0, 'reason': 'Normal movement detected'}
+
+# Reason codes emitted by the fall kernel, mapped to strings on the
+# (rare) reporting path
+_FALL_REASONS = {
+    0: "",
+    1: "Body in horizontal position with head below hips",
+    2: "Body in horizontal position",
+    3: "Head position below hips"
+}
+
+@njit(cache=True)
+def _fall_kernel(nose_y, lhip_y, rhip_y, lank_y, rank_y):
+    """Score the fall geometry; returns (confidence, reason_code,
+    body_height, body_width)"""
+    hip_y = (lhip_y + rhip_y) / 2.0
+    ankle_y = (lank_y + rank_y) / 2.0
+    body_height = abs(hip_y - nose_y)
+    body_width = abs(ankle_y - hip_y)
+
+    is_horizontal = body_width > body_height * 1.5
+    is_low_position = nose_y > hip_y
+
+    if is_horizontal and is_low_position:
+        return 0.8, 1, body_height, body_width
+    elif is_horizontal:
+        return 0.6, 2, body_height, body_width
+    elif is_low_position:
+        return 0.4, 3, body_height, body_width
+    return 0.0, 0, body_height, body_width
+
+@njit(cache=True)
+def _rapid_kernel(velocities, threshold):
+    """Count velocities above threshold and return the hit mask"""
+    mask = velocities > threshold
+    return mask.sum(), mask
+
+class VideoProcessor:
+    def __init__(self, model_complexity: int = 0,
+                 min_detection_confidence: float = 0.5,
+                 min_tracking_confidence: float = 0.5,
+                 input_height: int = 368,
+                 skip_frames: int = 2):
+        """
+        Initialize video processing with MediaPipe pose detection
+
+        Args:
+            model_complexity: MediaPipe pose model (0 = lite, 1 = full,
+                2 = heavy). The lite default covers the gross body
+                geometry the detectors use; pass 1 or 2 when landmark
+                accuracy matters more than frame rate.
+            min_detection_confidence: Confidence for the person detector
+            min_tracking_confidence: Confidence below which the detector re-runs
+            input_height: Frames taller than this are downscaled before
+                inference (0 disables the downscale)
+            skip_frames: Run inference every Nth frame and hold the
+                last detection in between (1 runs inference on every frame)
+        """
+        try:
+            self.input_height = input_height
+
+            # Skip-frame inference state: skipped frames reuse the last
+            # real detection instead of running the model
+            self._skip_k = max(1, skip_frames)
+            self._frame_counter = 0
+            self._last_kp = None
+            self._last_landmarks = None
+            self.mp_pose = mp.solutions.pose
+            self.mp_drawing = mp.solutions.drawing_utils
+            self.mp_drawing_styles = mp.solutions.drawing_styles
+
+            # Tracking mode (static_image_mode=False): the full person
+            # detector only re-runs when the landmark tracker loses
+            # confidence, which skips it on most frames of a live stream
+            self.pose = self.mp_pose.Pose(
+                static_image_mode=False,
+                model_complexity=model_complexity,
+                smooth_landmarks=True,
+                enable_segmentation=False,
+                smooth_segmentation=False,
+                min_detection_confidence=min_detection_confidence,
+                min_tracking_confidence=min_tracking_confidence
+            )
+            
+            # Keypoint mapping for easier access. Only the pose landmarks
+            # the seizure detector actually consumes are extracted — no
+            # face/hand models and no unused limb joints.
+            self.keypoint_names = {
+                'nose': 0,
+                'left_shoulder': 11,
+                'right_shoulder': 12,
+                'left_wrist': 15,
+                'right_wrist': 16,
+                'left_hip': 23,
+                'right_hip': 24,
+                'left_ankle': 27,
+                'right_ankle': 28
+            }
+
+            # Row gather index and name order for the (K, 4) keypoint array
+            self._kp_idx = np.array(list(self.keypoint_names.values()), dtype=np.int64)
+            self._kp_order = list(self.keypoint_names.keys())
+            self._name_to_row = {name: i for i, name in enumerate(self._kp_order)}
+
+            # Precomputed rows for the velocity calculation
+            self._velocity_parts = ['left_wrist', 'right_wrist', 'left_ankle', 'right_ankle', 'nose']
+            self._velocity_rows = np.array(
+                [self._name_to_row[p] for p in self._velocity_parts], dtype=np.int64)
+
+            # Rows whose visibility gates the fall geometry: one fused
+            # min-reduction replaces per-part membership checks
+            self._fall_rows = np.array(
+                [self._name_to_row[p] for p in
+                 ['nose', 'left_hip', 'right_hip', 'left_ankle', 'right_ankle']],
+                dtype=np.int64)
+
+            # Scratch buffer reused by draw_keypoints when the caller
+            # asks for a copy, and the landmark style built once instead
+            # of per draw call
+            self._draw_buf = None
+            self._pose_style = self.mp_drawing_styles.get_default_pose_landmarks_style()
+
+            # RGB destination reused by the per-frame BGR->RGB convert
+            self._rgb_buf = None
+
+            # MediaPipe Pose is not reentrant; serialize access so the
+            # processor can be shared across threads
+            self._pose_lock = threading.Lock()
+
+            # Pay the kernel JIT-compile cost at startup, not on the
+            # first real frame
+            _fall_kernel(0.0, 0.0, 0.0, 0.0, 0.0)
+            _rapid_kernel(np.zeros(1, dtype=np.float32), 0.0)
+
+            # Same for the pose graph: a blank-frame inference triggers
+            # the TFLite interpreter allocation and delegate setup here,
+            # not on the first real frame of a session
+            try:
+                self.pose.process(np.zeros((256, 256, 3), dtype=np.uint8))
+            except Exception as e:
+                logger.warning(f"Pose warmup inference failed: {e}")
+
+            logger.info("VideoProcessor initialized successfully")
+        except Exception as e:
+            logger.error(f"Failed to initialize VideoProcessor: {e}")
+            raise
+    
+    def extract_keypoints(self, frame: np.ndarray, rgb: bool = False) -> Optional[Dict]:
+        """
+        Extract body keypoints from a video frame using MediaPipe
+
+        Args:
+            frame: Input video frame (BGR format, or RGB if rgb=True)
+            rgb: Frame is already RGB; skip the BGR->RGB conversion
+
+        Returns:
+            Dictionary with the (K, 4) keypoint array, raw landmarks and
+            frame shape, or None if no pose detected
+        """
+        try:
+            if frame is None:
+                logger.warning("Received None frame")
+                return None
+
+            # The whole pipeline below shares per-instance state (the RGB
+            # scratch buffer, the Pose graph and the hold caches), so it
+            # runs one thread at a time
+            with self._pose_lock:
+                # Skipped frame: hold the last real detection. A
+                # zero-order hold keeps the emitted positions causal
+                # (interpolating toward an older detection would make
+                # the motion appear to jump backwards, then forwards at
+                # double speed); the detector sees 'interpolated' and
+                # knows the position carries no new motion information.
+                self._frame_counter += 1
+                if (self._skip_k > 1 and self._last_kp is not None
+                        and self._frame_counter % self._skip_k != 0):
+                    return {
+                        'keypoints': self._last_kp,
+                        'landmarks': self._last_landmarks,
+                        'frame_shape': frame.shape,
+                        'interpolated': True
+                    }
+
+                # Downscale for inference only: pose networks are tuned
+                # for small inputs and landmarks come back normalized, so
+                # pixel coordinates below still use the original frame shape
+                proc_frame = frame
+                if self.input_height and frame.shape[0] > self.input_height:
+                    scale = self.input_height / frame.shape[0]
+                    proc_frame = cv2.resize(frame, None, fx=scale, fy=scale,
+                                            interpolation=cv2.INTER_AREA)
+
+                # MediaPipe consumes RGB; only convert when given BGR. The
+                # convert is a pure memory reorder, so writing into the same
+                # destination every frame avoids a fresh multi-MB allocation.
+                if rgb:
+                    rgb_frame = proc_frame
+                else:
+                    if self._rgb_buf is None or self._rgb_buf.shape != proc_frame.shape:
+                        self._rgb_buf = np.empty_like(proc_frame)
+                    cv2.cvtColor(proc_frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+                    rgb_frame = self._rgb_buf
+
+                # Process the frame
+                results = self.pose.process(rgb_frame)
+
+                if results.pose_landmarks is None:
+                    # Pose lost: drop the caches so skipped frames don't
+                    # keep holding a vanished subject
+                    self._last_kp = None
+                    self._last_landmarks = None
+                    return None
+
+                # Extract keypoints and refresh the hold caches
+                keypoints = self._extract_landmarks(results.pose_landmarks, frame.shape)
+                self._last_kp = keypoints
+                self._last_landmarks = results.pose_landmarks
+
+                return {
+                    'keypoints': keypoints,
+                    'landmarks': results.pose_landmarks,
+                    'frame_shape': frame.shape
+                }
+
+        except Exception as e:
+            logger.error(f"Error extracting keypoints: {e}")
+            return None
+    
+    def _extract_landmarks(self, landmarks, frame_shape: Tuple[int, int, int]) -> np.ndarray:
+        """
+        Extract landmark coordinates and convert to pixel coordinates
+
+        Args:
+            landmarks: MediaPipe pose landmarks
+            frame_shape: Shape of the input frame (height, width, channels)
+
+        Returns:
+            (K, 4) float32 array with columns x, y (rounded pixel
+            coordinates), z (normalized depth) and visibility, with rows
+            ordered like keypoint_names
+        """
+        height, width = frame_shape[:2]
+
+        # Bulk-copy the landmark protobuf into one (33, 4) array, gather
+        # the rows we use, and scale to pixel space by broadcasting
+        arr = np.fromiter(
+            (v for lm in landmarks.landmark for v in (lm.x, lm.y, lm.z, lm.visibility)),
+            dtype=np.float32, count=len(landmarks.landmark) * 4
+        ).reshape(-1, 4)
+
+        keypoints = arr[self._kp_idx]
+        keypoints[:, 0] *= width
+        keypoints[:, 1] *= height
+        np.rint(keypoints[:, :2], out=keypoints[:, :2])
+
+        return keypoints
+    
+    def calculate_movement_velocity(self, keypoints: np.ndarray,
+                                    prev_keypoints: Optional[np.ndarray]) -> Dict:
+        """
+        Calculate movement velocity for key body parts
+
+        Args:
+            keypoints: Current frame (K, 4) keypoint array
+            prev_keypoints: Previous frame (K, 4) keypoint array
+
+        Returns:
+            Dictionary with velocity data for different body parts
+        """
+        if prev_keypoints is None:
+            return {}
+
+        # One vectorized subtract + hypot over the precomputed rows:
+        # np.hypot computes all Euclidean distances in a single ufunc
+        # call with no intermediate square/sum temporaries
+        diff = keypoints[self._velocity_rows, :2] - prev_keypoints[self._velocity_rows, :2]
+        velocities = np.hypot(diff[:, 0], diff[:, 1])
+
+        # Dict view kept for API compatibility
+        return dict(zip(self._velocity_parts, velocities.tolist()))
+    
+    def detect_fall(self, keypoints: np.ndarray) -> Dict:
+        """
+        Detect potential fall based on body position
+
+        Args:
+            keypoints: Current frame (K, 4) keypoint array
+
+        Returns:
+            Dictionary with fall detection results
+        """
+        try:
+            row = self._name_to_row
+
+            # Skip the geometry when any gating landmark is occluded
+            if float(keypoints[self._fall_rows, 3].min()) < 0.5:
+                return {'detected': False, 'confidence': 0.0,
+                        'reason': 'Required keypoints not visible'}
+
+            # All numeric work happens in the compiled kernel; only the
+            # result dict is built in Python
+            fall_confidence, reason_code, body_height, body_width = _fall_kernel(
+                float(keypoints[row['nose'], 1]),
+                float(keypoints[row['left_hip'], 1]),
+                float(keypoints[row['right_hip'], 1]),
+                float(keypoints[row['left_ankle'], 1]),
+                float(keypoints[row['right_ankle'], 1])
+            )
+
+            return {
+                'detected': fall_confidence > 0.5,
+                'confidence': fall_confidence,
+                'reason': _FALL_REASONS[reason_code],
+                'body_height': body_height,
+                'body_width': body_width
+            }
+
+        except Exception as e:
+            logger.error(f"Error in fall detection: {e}")
+            return {'detected': False, 'confidence': 0.0, 'reason': f'Error: {str(e)}'}
+
+    def detect_rapid_movements(self, velocities: Dict, threshold: float = 50.0) -> Dict:
+        """
+        Detect rapid repetitive movements
+
+        Args:
+            velocities: Movement velocities for body parts
+            threshold: Velocity threshold for rapid movement detection
+
+        Returns:
+            Dictionary with rapid movement detection results
+        """
+        parts = list(velocities)
+        vel_arr = np.fromiter(velocities.values(), dtype=np.float32, count=len(parts))
+
+        # Compiled threshold scan; dicts are only built on the hit path
+        hit_count, mask = _rapid_kernel(vel_arr, threshold)
+
+        if hit_count:
+            idx = mask.nonzero()[0]
+            severities = np.where(vel_arr[idx] > threshold * 2, 'high', 'medium')
+            rapid_movements = [
+                {'part': parts[i], 'velocity': float(vel_arr[i]), 'severity': str(s)}
+                for i, s in zip(idx, severities)
+            ]
+            return {
+                'detected': True,
+                'confidence': min(0.9, int(hit_count) * 0.3),
+                'movements': rapid_movements,
+                'reason': f"Detected {int(hit_count)} rapid movements"
+            }
+
+        return _NO_RAPID
+    
+    def detect_immobility(self, keypoints: np.ndarray,
+                          prev_keypoints: Optional[np.ndarray],
+                          immobility_threshold: float = 5.0) -> Dict:
+        """
+        Detect immobility (freezing episode)
+
+        Args:
+            keypoints: Current frame (K, 4) keypoint array
+            prev_keypoints: Previous frame (K, 4) keypoint array
+            immobility_threshold: Threshold for considering movement as immobile
+
+        Returns:
+            Dictionary with immobility detection results
+        """
+        if prev_keypoints is None:
+            return _NO_PREV_FRAME
+
+        # Average movement across all keypoints in one vectorized norm
+        diff = keypoints[:, :2] - prev_keypoints[:, :2]
+        avg_movement = float(np.linalg.norm(diff, axis=1).mean())
+
+        if avg_movement < immobility_threshold:
+            return {
+                'detected': True,
+                'confidence': 0.7,
+                'reason': f"Low movement detected (avg: {avg_movement:.2f})",
+                'avg_movement': avg_movement
+            }
+
+        return _NO_IMMOBILITY
+    
+    def draw_keypoints(self, frame: np.ndarray, keypoints_data: Dict,
+                       inplace: bool = True) -> np.ndarray:
+        """
+        Draw keypoints on the frame for visualization
+
+        Args:
+            frame: Input frame (annotated in place by default)
+            keypoints_data: Keypoints data from extract_keypoints
+            inplace: Draw directly on the caller's frame, avoiding a
+                full-frame copy; pass False to keep the input untouched
+                and draw on a reused internal buffer instead
+
+        Returns:
+            Frame with keypoints drawn
+        """
+        if keypoints_data is None or 'landmarks' not in keypoints_data:
+            return frame
+
+        if inplace:
+            annotated_frame = frame
+        else:
+            # Reuse one scratch buffer rather than allocating a copy
+            # every frame
+            if self._draw_buf is None or self._draw_buf.shape != frame.shape:
+                self._draw_buf = np.empty_like(frame)
+            np.copyto(self._draw_buf, frame)
+            annotated_frame = self._draw_buf
+
+        # Draw the pose landmarks
+        self.mp_drawing.draw_landmarks(
+            annotated_frame,
+            keypoints_data['landmarks'],
+            self.mp_pose.POSE_CONNECTIONS,
+            landmark_drawing_spec=self._pose_style
+        )
+        
+        return annotated_frame
+    
+    def release(self):
+        """Release resources"""
+        try:
+            if hasattr(self, 'pose'):
+                self.pose.close()
+            logger.info("VideoProcessor resources released")
+        except Exception as e:
+            logger.error(f"Error releasing VideoProcessor resources: {e}")
+
+
+# Sentinel pushed through the pipeline queues to shut the stages down
+_SENTINEL = object()
+
+
+class AsyncVideoProcessor:
+    """Three-stage producer/consumer pipeline around a VideoProcessor.
+
+    Stage A converts BGR frames to RGB, stage B runs pose inference and
+    stage C hands results to the caller's callback. The stages are
+    connected by small bounded queues, so throughput is set by the
+    slowest stage (inference) instead of the sum of all three, and
+    conversion/callback work overlaps the GIL-releasing inference.
+    Stage B owns the MediaPipe Pose instance exclusively.
+    """
+
+    def __init__(self, processor: Optional[VideoProcessor] = None,
+                 result_callback: Optional[Callable[[Optional[Dict]], None]] = None,
+                 queue_size: int = 2):
+        """
+        Args:
+            processor: VideoProcessor to wrap (a default one is built
+                when omitted)
+            result_callback: Called from stage C with each extraction
+                result (the extract_keypoints dict, or None when no
+                pose was detected)
+            queue_size: Depth of the inter-stage queues; small values
+                bound latency, large values smooth jitter
+        """
+        self.processor = processor or VideoProcessor()
+        self.result_callback = result_callback
+
+        self._convert_q = queue.Queue(maxsize=queue_size)
+        self._infer_q = queue.Queue(maxsize=queue_size)
+        self._result_q = queue.Queue(maxsize=queue_size)
+        self._closed = False
+
+        self._threads = [
+            threading.Thread(target=self._convert_loop, name='pipeline-convert', daemon=True),
+            threading.Thread(target=self._inference_loop, name='pipeline-inference', daemon=True),
+            threading.Thread(target=self._result_loop, name='pipeline-result', daemon=True),
+        ]
+        for t in self._threads:
+            t.start()
+
+    def submit(self, frame: np.ndarray) -> bool:
+        """Queue a BGR frame for processing.
+
+        Drops the frame and returns False when the pipeline is full, so
+        a fast producer bounds latency instead of growing a backlog.
+        """
+        if self._closed:
+            return False
+        try:
+            self._convert_q.put_nowait(frame)
+            return True
+        except queue.Full:
+            return False
+
+    def _convert_loop(self):
+        """Stage A: BGR->RGB conversion off the inference thread"""
+        while True:
+            frame = self._convert_q.get()
+            if frame is _SENTINEL:
+                self._put_dropping(self._infer_q, _SENTINEL)
+                return
+            try:
+                self._put_dropping(self._infer_q, cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            except Exception as e:
+                logger.error(f"Pipeline convert stage failed: {e}")
+
+    def _inference_loop(self):
+        """Stage B: pose inference; sole user of the Pose instance"""
+        while True:
+            rgb_frame = self._infer_q.get()
+            if rgb_frame is _SENTINEL:
+                self._put_dropping(self._result_q, _SENTINEL)
+                return
+            try:
+                result = self.processor.extract_keypoints(rgb_frame, rgb=True)
+                self._put_dropping(self._result_q, result)
+            except Exception as e:
+                logger.error(f"Pipeline inference stage failed: {e}")
+
+    def _result_loop(self):
+        """Stage C: deliver results to the caller's callback"""
+        while True:
+            result = self._result_q.get()
+            if result is _SENTINEL:
+                return
+            if self.result_callback is None:
+                continue
+            try:
+                self.result_callback(result)
+            except Exception as e:
+                logger.error(f"Pipeline result callback failed: {e}")
+
+    @staticmethod
+    def _put_dropping(q: queue.Queue, item):
+        """put_nowait that drops the oldest queued item when full, so
+        sentinels always get through and stalls shed stale frames"""
+        while True:
+            try:
+                q.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    q.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def close(self):
+        """Drain the stages via sentinels and release the processor"""
+        if self._closed:
+            return
+        self._closed = True
+        self._put_dropping(self._convert_q, _SENTINEL)
+        for t in self._threads:
+            t.join(timeout=5.0)
+        self.processor.release()